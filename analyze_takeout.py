@@ -1,26 +1,78 @@
 ﻿import os
 import sys
 import argparse
-import glob
 import re
 import pickle
+import functools
+import threading
 import pathlib
 import webbrowser
+import numpy as np
 import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
 from typing import List, Optional
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from dotenv import load_dotenv
 
+try:
+    import polars as pl
+    _HAS_POLARS = True
+except ImportError:
+    _HAS_POLARS = False
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Arrow-backed strings when pyarrow is installed, pandas' own string dtype otherwise
+try:
+    _STRING_DTYPE = pd.StringDtype("pyarrow")
+except ImportError:
+    _STRING_DTYPE = pd.StringDtype()
+
 # Load environment variables
 load_dotenv()
 CLIENT_SECRETS_FILE = os.getenv("YOUTUBE_CREDENTIALS")
 SCOPES = ["https://www.googleapis.com/auth/youtube.force-ssl"]
 TOKEN_FILE = "token.pickle"
+STATS_CACHE_FILE = "stats_cache.pickle"
+TITLES_CACHE_FILE = "video_titles_cache.pickle"
+MAX_WORKERS = 8  # Concurrent API batches in flight
+API_BATCH_LIMIT = 1000  # Max calls per batch HTTP request (googleapiclient limit)
+CLEAN_CHUNK_ROWS = 2048  # Rows per worker task when cleaning with --workers
+HTML_CHUNK_ROWS = 2000  # Rows rendered per to_html call when writing the report
 
-def get_authenticated_service():
+# Robust regex to capture content inside "text":"..." handling escaped quotes
+# Matches "text":" followed by (anything that is NOT a quote OR an escaped char)* until "
+_TEXT_RE = re.compile(r'"text":"((?:[^"\\]|\\.)*)"')
+
+# Simplistic unescape for the common JSON escapes found in comment text
+_UNESCAPES = {'\\"': '"', '\\\\': '\\', '\\/': '/', '\\n': '\n'}
+_ESCAPE_RE = re.compile(r'\\[\\/"n]')
+
+class OrjsonModel(JsonModel):
+    # JsonModel that decodes API responses with orjson instead of the json module
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+@functools.lru_cache(maxsize=1)
+def get_credentials():
     creds = None
     if os.path.exists(TOKEN_FILE):
         with open(TOKEN_FILE, "rb") as token:
@@ -39,142 +91,265 @@ def get_authenticated_service():
             
         with open(TOKEN_FILE, "wb") as token:
             pickle.dump(creds, token)
-            
-    return build("youtube", "v3", credentials=creds)
 
-def find_comments_file():
+    return creds
+
+@functools.lru_cache(maxsize=1)
+def get_authenticated_service():
+    creds = get_credentials()
+    # Use the discovery document bundled with googleapiclient instead of fetching it
+    model = OrjsonModel() if _HAS_ORJSON else None
+    return build("youtube", "v3", credentials=creds, static_discovery=True, cache_discovery=False, model=model)
+
+# httplib2 connections are not thread-safe, so each worker thread gets its own
+_thread_state = threading.local()
+
+def _thread_http():
+    http = getattr(_thread_state, "http", None)
+    if http is None:
+        # build_http() applies googleapiclient's default timeout and redirect handling
+        http = AuthorizedHttp(get_credentials(), http=build_http())
+        _thread_state.http = http
+    return http
+
+def find_comments_file(root="."):
     print("Searching for 'comments.csv' in current directory...")
-    files = glob.glob("**/comments.csv", recursive=True)
-    if files:
-        print(f"Found: {files[0]}")
-        return files[0]
+    # Breadth-first walk that stops at the first (shallowest) match
+    pending = deque([root])
+    while pending:
+        directory = pending.popleft()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                # Like glob("**"), skip hidden entries such as .git or .venv
+                if entry.name.startswith("."):
+                    continue
+                if entry.name == "comments.csv" and entry.is_file():
+                    path = os.path.relpath(entry.path)
+                    print(f"Found: {path}")
+                    return path
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
     return None
 
+def read_takeout_csv(csv_path, engine="pandas"):
+    # Read every column as a string (like IDs) so no type inference pass is needed
+    if engine == "polars":
+        if _HAS_POLARS:
+            # Hand pandas Arrow-backed columns without a copy
+            return pl.read_csv(csv_path, infer_schema_length=0).to_pandas(use_pyarrow_extension_array=True)
+        print("Warning: polars is not installed, falling back to pandas.")
+    return pd.read_csv(csv_path, dtype=_STRING_DTYPE)
+
+def _unescape(match):
+    return _UNESCAPES[match.group(0)]
+
 def clean_comment_text(text_str):
-    if pd.isna(text_str): 
-        return ""
-    
-    try:
-        # Normalize: Google Takeout often uses double-double quotes ""text"" inside the CSV
-        # (Though pd.read_csv usually handles this, sometimes artifacts remain or we want to be safe)
-        normalized = str(text_str).replace('""', '"')
-        
-        # Robust regex to capture content inside "text":"..." handling escaped quotes
-        # Matches "text":" followed by (anything that is NOT a quote OR an escaped char)* until "
-        matches = re.findall(r'"text":"((?:[^"\\]|\\.)*)"', normalized)
-        
-        if matches:
-            # Unescape the captured JSON string content (e.g. \" -> ")
-            decoded_matches = []
-            for m in matches:
-                try:
-                    # simplistic unescape for common JSON escapes
-                    decoded = m.replace(r'\"', '"').replace(r'\\', '\\').replace(r'\/', '/')
-                    decoded_matches.append(decoded)
-                except:
-                    decoded_matches.append(m)
-            
-            full_text = " ".join(decoded_matches)
-            return full_text.replace('\\n', '\n')
-            
-    except Exception:
-        pass
-        
-    return text_str
+    # Single-value convenience wrapper; the rules live in clean_comment_series
+    return clean_comment_series(pd.Series([text_str], dtype=object)).iloc[0]
+
+def clean_comment_series(texts):
+    # Normalize: Google Takeout often uses double-double quotes ""text"" inside the CSV
+    # (Though pd.read_csv usually handles this, sometimes artifacts remain or we want to be safe)
+    raw = texts.fillna("").astype(str)
+    normalized = raw.str.replace('""', '"', regex=False)
+
+    # One row per "text":"..." match, indexed by (original row, match number)
+    matches = normalized.str.extractall(_TEXT_RE)[0]
+    # Unescape the captured JSON string content (e.g. \" -> ") in a single pass
+    joined = matches.groupby(level=0).agg(" ".join).str.replace(_ESCAPE_RE, _unescape, regex=True)
+
+    # Rows without any "text" segment keep their original value
+    return joined.reindex(texts.index).fillna(raw)
 
-def fetch_comment_stats(youtube, df_takeout):
-    stats_data = []
+def clean_comments(texts, workers=1):
+    # With several workers, each process runs clean_comment_series over its own
+    # slice of rows, so the output is identical to the single-process path
+    if workers > 1 and len(texts) > CLEAN_CHUNK_ROWS:
+        chunks = [texts.iloc[i:i+CLEAN_CHUNK_ROWS] for i in range(0, len(texts), CLEAN_CHUNK_ROWS)]
+        with Pool(workers) as pool:
+            return pd.concat(pool.imap(clean_comment_series, chunks))
+    return clean_comment_series(texts)
+
+def _load_cache(path):
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"    Warning: Ignoring unreadable cache {path}: {e}")
+    return {}
+
+def _save_cache(path, cache):
+    with open(path, "wb") as f:
+        pickle.dump(cache, f)
+
+def _execute_batched(youtube, requests, callback):
+    # Pack the API calls into multipart batch requests (one HTTP round-trip per
+    # API_BATCH_LIMIT calls) and send the batches concurrently
+    groups = [requests[i:i+API_BATCH_LIMIT] for i in range(0, len(requests), API_BATCH_LIMIT)]
+
+    def execute_group(group):
+        batch = youtube.new_batch_http_request(callback=callback)
+        for request in group:
+            batch.add(request)
+        try:
+            batch.execute(http=_thread_http())
+        except Exception as e:
+            print(f"    Warning: API Error executing batch request: {e}")
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        list(executor.map(execute_group, groups))
+
+def fetch_comment_stats(youtube, df_takeout, use_cache=False):
+    # Comment ID -> (Likes, Replies, Published At, Video ID)
+    fetched = {}
+
+    # Cached stats use the same layout; they are only reused with --cached
+    # since like counts go stale, but every run refreshes the cache
+    cache = _load_cache(STATS_CACHE_FILE)
+    skip_ids = cache if use_cache else {}
     
     # Split into Top-level comments and Replies
     # Parent Comment ID is NaN/empty for top-level comments
     top_level_df = df_takeout[df_takeout["Parent Comment ID"].isna() | (df_takeout["Parent Comment ID"] == "")]
     reply_df = df_takeout[df_takeout["Parent Comment ID"].notna() & (df_takeout["Parent Comment ID"] != "")]
     
-    total_top = len(top_level_df)
-    total_reply = len(reply_df)
+    # Drop duplicate and already cached IDs before batching
+    top_level_ids = [cid for cid in dict.fromkeys(top_level_df["Comment ID"]) if cid not in skip_ids]
+    reply_ids = [cid for cid in dict.fromkeys(reply_df["Comment ID"]) if cid not in skip_ids]
     
-    print(f"Fetching stats for {total_top} top-level comments (Likes + Replies)...")
-    top_level_ids = top_level_df["Comment ID"].tolist()
-    for i in range(0, total_top, 50):
-        batch = top_level_ids[i:i+50]
-        try:
-            request = youtube.commentThreads().list(
-                part="snippet",
-                id=",".join(batch)
+    total_top = len(top_level_ids)
+    total_reply = len(reply_ids)
+
+    def collect_top_level(request_id, response, exception):
+        if exception is not None:
+            print(f"    Warning: API Error on top-level batch: {exception}")
+            return
+        for item in response.get("items", []):
+            snippet = item["snippet"]
+            top_comment = snippet["topLevelComment"]["snippet"]
+            fetched[item["id"]] = (
+                int(top_comment.get("likeCount", 0)),
+                int(snippet.get("totalReplyCount", 0)),
+                top_comment.get("publishedAt"),
+                top_comment.get("videoId")
             )
-            response = request.execute()
-            for item in response.get("items", []):
-                snippet = item["snippet"]
-                top_comment = snippet["topLevelComment"]["snippet"]
-                stats_data.append({
-                    "Comment ID": item["id"],
-                    "Likes": int(top_comment.get("likeCount", 0)),
-                    "Replies": int(snippet.get("totalReplyCount", 0)),
-                    "Published At": top_comment.get("publishedAt"),
-                    "Video ID": top_comment.get("videoId")
-                })
-        except Exception as e:
-            print(f"    Warning: API Error on top-level batch: {e}")
 
-    print(f"Fetching stats for {total_reply} replies (Likes only)...")
-    reply_ids = reply_df["Comment ID"].tolist()
-    for i in range(0, total_reply, 50):
-        batch = reply_ids[i:i+50]
-        try:
-            request = youtube.comments().list(
-                part="snippet",
-                id=",".join(batch)
+    def collect_replies(request_id, response, exception):
+        if exception is not None:
+            print(f"    Warning: API Error on reply batch: {exception}")
+            return
+        for item in response.get("items", []):
+            snippet = item["snippet"]
+            fetched[item["id"]] = (
+                int(snippet.get("likeCount", 0)),
+                0, # Replies to replies don't have a count in this API
+                snippet.get("publishedAt"),
+                snippet.get("videoId")
             )
-            response = request.execute()
-            for item in response.get("items", []):
-                snippet = item["snippet"]
-                stats_data.append({
-                    "Comment ID": item["id"],
-                    "Likes": int(snippet.get("likeCount", 0)),
-                    "Replies": 0, # Replies to replies don't have a count in this API
-                    "Published At": snippet.get("publishedAt"),
-                    "Video ID": snippet.get("videoId")
-                })
-        except Exception as e:
-            print(f"    Warning: API Error on reply batch: {e}")
-            
-    return pd.DataFrame(stats_data)
+    
+    print(f"Fetching stats for {total_top} top-level comments (Likes + Replies)...")
+    # Partial responses: only request the fields that are actually read below
+    requests = [
+        youtube.commentThreads().list(
+            part="snippet",
+            id=",".join(top_level_ids[i:i+50]),
+            fields="items(id,snippet(totalReplyCount,topLevelComment/snippet(likeCount,publishedAt,videoId)))"
+        )
+        for i in range(0, total_top, 50)
+    ]
+    _execute_batched(youtube, requests, collect_top_level)
+
+    print(f"Fetching stats for {total_reply} replies (Likes only)...")
+    requests = [
+        youtube.comments().list(
+            part="snippet",
+            id=",".join(reply_ids[i:i+50]),
+            fields="items(id,snippet(likeCount,publishedAt,videoId))"
+        )
+        for i in range(0, total_reply, 50)
+    ]
+    _execute_batched(youtube, requests, collect_replies)
+
+    cache.update(fetched)
+    _save_cache(STATS_CACHE_FILE, cache)
+
+    # Build the frame column by column rather than from per-row dicts
+    source = cache if use_cache else fetched
+    comment_ids = [cid for cid in dict.fromkeys(df_takeout["Comment ID"]) if cid in source]
+    likes, replies, published, video_ids = zip(*(source[cid] for cid in comment_ids)) if comment_ids else ((), (), (), ())
+    return pd.DataFrame({
+        "Comment ID": comment_ids,
+        "Likes": np.asarray(likes, dtype=np.int32),
+        "Replies": np.asarray(replies, dtype=np.int32),
+        "Published At": list(published),
+        "Video ID": list(video_ids)
+    })
 
 def fetch_video_titles(youtube, video_ids):
-    video_data = {}
-    unique_ids = list(set([vid for vid in video_ids if vid])) # Remove empty/None
+    # Video titles rarely change, so cached titles are always reused
+    video_data = _load_cache(TITLES_CACHE_FILE)
+    unique_ids = [vid for vid in set(video_ids) if vid and vid not in video_data] # Remove empty/None/cached
     total = len(unique_ids)
     
-    print(f"Fetching titles for {total} unique videos...")
+    print(f"Fetching titles for {total} unique videos ({len(video_data)} cached)...")
+
+    def collect_titles(request_id, response, exception):
+        if exception is not None:
+            print(f"    Warning: API Error fetching video titles: {exception}")
+            return
+        for item in response.get("items", []):
+            video_data[item["id"]] = item["snippet"]["title"]
     
-    for i in range(0, total, 50):
-        batch = unique_ids[i:i+50]
-        ids_string = ",".join(batch)
-        
-        try:
-            request = youtube.videos().list(
-                part="snippet",
-                id=ids_string
-            )
-            response = request.execute()
+    requests = [
+        youtube.videos().list(
+            part="snippet",
+            id=",".join(unique_ids[i:i+50]),
+            fields="items(id,snippet/title)"
+        )
+        for i in range(0, total, 50)
+    ]
+    _execute_batched(youtube, requests, collect_titles)
 
-            for item in response.get("items", []):
-                video_data[item["id"]] = item["snippet"]["title"]
-                
-        except Exception as e:
-            print(f"    Warning: API Error fetching video titles: {e}")
+    if total:
+        _save_cache(TITLES_CACHE_FILE, video_data)
             
     return video_data
 
+def merge_stats(df_takeout, df_stats, engine="pandas"):
+    # Join the Takeout rows with their API stats, most liked first
+    if engine == "polars" and _HAS_POLARS:
+        # Mirror pandas' _x/_y suffixes for overlapping columns (e.g. Video ID)
+        overlap = (set(df_takeout.columns) & set(df_stats.columns)) - {"Comment ID"}
+        left = pl.from_pandas(df_takeout).rename({col: f"{col}_x" for col in overlap}).lazy()
+        right = pl.from_pandas(df_stats).rename({col: f"{col}_y" for col in overlap}).lazy()
+        return (
+            left.join(right, on="Comment ID", how="inner")
+            .sort("Likes", descending=True)
+            .collect()
+            .to_pandas(use_pyarrow_extension_array=True)
+        )
+
+    final_df = pd.merge(df_takeout, df_stats, on="Comment ID", how="inner")
+    return final_df.sort_values("Likes", ascending=False)
+
+def write_csv(df, filename, engine="pandas"):
+    if engine == "polars" and _HAS_POLARS:
+        pl.from_pandas(df).write_csv(filename)
+    else:
+        df.to_csv(filename, index=False)
+
 def generate_html_report(df, filename):
     # 'Video' column already contains the HTML link with the Title
-    html_df = df[["Likes", "Replies", "Comment", "Video", "Published At"]].copy()
+    html_df = df[["Likes", "Replies", "Comment", "Video", "Published At"]]
     
     pd.set_option('colheader_justify', 'center')
     
-    table_html = html_df.to_html(classes='table table-striped table-hover', escape=False, index=False, table_id="commentsTable")
-    
-    html_string = f"""
+    prologue = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -186,58 +361,58 @@ def generate_html_report(df, filename):
         <!-- DataTables CSS -->
         <link rel="stylesheet" href="https://cdn.datatables.net/1.13.4/css/dataTables.bootstrap5.min.css">
         <style>
-            body {{
+            body {
                 background-color: #f8f9fa;
                 font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            }}
-            .container {{
+            }
+            .container {
                 background-color: white;
                 padding: 30px;
                 border-radius: 10px;
                 margin-top: 50px;
                 margin-bottom: 50px;
-            }}
-            h1 {{
+            }
+            h1 {
                 color: #212529;
                 text-align: center;
                 margin-bottom: 10px;
                 font-weight: bold;
-            }}
-            p.subtitle {{
+            }
+            p.subtitle {
                 text-align: center;
                 color: #6c757d;
                 margin-bottom: 30px;
-            }}
-            table.dataTable thead th {{
+            }
+            table.dataTable thead th {
                 background-color: #212529;
                 color: white;
-            }}
-            .dataTables_filter input {{
+            }
+            .dataTables_filter input {
                 border-radius: 20px;
                 padding: 5px 15px;
-            }}
-            .dataTables_wrapper {{
+            }
+            .dataTables_wrapper {
                 margin-top: 20px;
-            }}
+            }
             /* Extra padding to prevent focus glow clipping */
             div.dataTables_wrapper div.dataTables_filter, 
-            div.dataTables_wrapper div.dataTables_length {{
+            div.dataTables_wrapper div.dataTables_length {
                 margin-bottom: 10px;
                 padding: 5px;
-            }}
+            }
             /* Specific width for Published At column */
             #commentsTable th:nth-child(5), 
-            #commentsTable td:nth-child(5) {{
+            #commentsTable td:nth-child(5) {
                 min-width: 120px;
-            }}
+            }
         </style>
     </head>
     <body>
         <div class="container">
             <h1>My Top YouTube Comments</h1>
             <div class="table-responsive">
-                {table_html}
-            </div>
+"""
+    epilogue = """            </div>
         </div>
 
         <!-- jQuery -->
@@ -247,25 +422,43 @@ def generate_html_report(df, filename):
         <script src="https://cdn.datatables.net/1.13.4/js/dataTables.bootstrap5.min.js"></script>
         
         <script>
-            $(document).ready(function () {{
-                $('#commentsTable').DataTable({{
+            $(document).ready(function () {
+                $('#commentsTable').DataTable({
                     "order": [[ 0, "desc" ]], // Sort by Likes (1st column) descending by default
                     "pageLength": 25,
-                    "language": {{
+                    "language": {
                         "search": "Search:"
-                    }}
-                }});
-            }});
+                    }
+                });
+            });
         </script>
     </body>
     </html>
     """
+
+    # Stream the table to disk in row slices instead of building one giant string.
+    # Every slice renders as its own <table>, so only the first keeps the opening
+    # tags and header, and the closing tags are written once at the end.
     with open(filename, "w", encoding="utf-8") as f:
-        f.write(html_string)
+        f.write(prologue)
+        for start in range(0, max(len(html_df), 1), HTML_CHUNK_ROWS):
+            chunk_html = html_df.iloc[start:start+HTML_CHUNK_ROWS].to_html(
+                classes='table table-striped table-hover', escape=False, index=False,
+                table_id="commentsTable", header=(start == 0)
+            )
+            rows_html = chunk_html.rsplit("</tbody>", 1)[0]
+            if start > 0:
+                rows_html = rows_html.split("<tbody>", 1)[1]
+            f.write(rows_html)
+        f.write("</tbody>\n</table>\n")
+        f.write(epilogue)
 
 def main():
     parser = argparse.ArgumentParser(description="Analyze YouTube Comment History")
     parser.add_argument("csv_path", nargs="?", help="Path to comments.csv from Google Takeout")
+    parser.add_argument("--engine", choices=["pandas", "polars"], default="pandas", help="Engine for reading, joining and writing the data (polars is faster for large exports)")
+    parser.add_argument("--workers", type=int, default=1, help="Processes used to clean comment text (useful for very large exports)")
+    parser.add_argument("--cached", action="store_true", help="Reuse like counts cached by a previous run instead of re-fetching them")
     args = parser.parse_args()
 
     csv_path = args.csv_path
@@ -277,8 +470,8 @@ def main():
         sys.exit(1)
 
     print(f"Reading: {csv_path}")
-    df_takeout = pd.read_csv(csv_path)
-    df_takeout['Comment'] = df_takeout['Comment Text'].apply(clean_comment_text)
+    df_takeout = read_takeout_csv(csv_path, engine=args.engine)
+    df_takeout['Comment'] = clean_comments(df_takeout['Comment Text'], workers=args.workers)
     print(f"Parsed {len(df_takeout)} comments.")
 
     try:
@@ -287,11 +480,10 @@ def main():
         print(f"Authentication Failed: {e}")
         sys.exit(1)
 
-    df_stats = fetch_comment_stats(youtube, df_takeout)
+    df_stats = fetch_comment_stats(youtube, df_takeout, use_cache=args.cached)
 
     if not df_stats.empty:
-        final_df = pd.merge(df_takeout, df_stats, on="Comment ID", how="inner")
-        final_df = final_df.sort_values("Likes", ascending=False)
+        final_df = merge_stats(df_takeout, df_stats, engine=args.engine)
 
         # Fix Video ID Merging Logic
         # We might have Video ID_y (API) and Video ID_x (Takeout)
@@ -306,25 +498,36 @@ def main():
         video_titles_map = fetch_video_titles(youtube, video_ids)
         final_df["Video Title"] = final_df["Video ID"].map(video_titles_map).fillna("Unknown Video")
 
-        final_df["Video"] = final_df.apply(
-            lambda x: f'<a href="https://www.youtube.com/watch?v={x["Video ID"]}&lc={x["Comment ID"]}" target="_blank">{x["Video Title"]}</a>', axis=1
+        # Build the comment links column-wise instead of row by row
+        video_urls = (
+            "https://www.youtube.com/watch?v=" + final_df["Video ID"].astype(_STRING_DTYPE)
+            + "&lc=" + final_df["Comment ID"].astype(_STRING_DTYPE)
+        )
+        final_df["Video"] = (
+            '<a href="' + video_urls + '" target="_blank">'
+            + final_df["Video Title"].astype(_STRING_DTYPE) + '</a>'
         )
 
         # Format Published At
         if "Published At" in final_df.columns:
-            final_df["Published At"] = pd.to_datetime(final_df["Published At"]).dt.strftime("%Y-%m-%d %H:%M")
+            # The API returns ISO-8601 timestamps; the ISO8601 fast path skips per-string
+            # inference while still accepting fractional seconds and other offsets
+            final_df["Published At"] = pd.to_datetime(
+                final_df["Published At"], format="ISO8601", utc=True, cache=True
+            ).dt.strftime("%Y-%m-%d %H:%M")
 
-        display_df = final_df[["Likes", "Replies", "Comment", "Video Title", "Published At"]].copy()
+        # Only the top 3 rows are shown, so slice rows before selecting columns
+        display_df = final_df.head(3)[["Likes", "Replies", "Comment", "Video Title", "Published At"]]
         
         print("\n" + "="*60)
         print("TOP 3 MOST LIKED COMMENTS")
         print("="*60)
         # Set pandas options to show full text in terminal without truncation
         with pd.option_context('display.max_colwidth', None, 'display.width', 2000):
-            print(display_df.head(3).to_string(index=False))
+            print(display_df.to_string(index=False))
         print("\n")
 
-        final_df.to_csv("my_comments_with_likes.csv", index=False)
+        write_csv(final_df, "my_comments_with_likes.csv", engine=args.engine)
         generate_html_report(final_df, "my_comments_with_likes.html")
         
         print("Success! Reports generated:")